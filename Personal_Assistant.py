@@ -9,12 +9,55 @@ from rich.table import Table
 from rich.text import Text
 from dateutil import parser
 from rich.live import Live
+from rich.progress import Progress
 import csv
+import ctypes
+import ctypes.util
+import gzip
+import io
+import json
+import select
+import shlex
 import shutil
-from pathlib import Path
+import struct
+import tarfile
+import threading
+import time
+import zipfile
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+import numpy as np
 
 console = Console()
 
+# Допустимі формати: +380501234567, 050-123-45-67, 0501234567, (050)123-45-67, 0989898989
+PHONE_PATTERN = re.compile(r'^\+?\d{1,3}?[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}$')
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
+# Розмір частини файлу (у байтах), яку обробляє один процес під час масового імпорту
+IMPORT_CHUNK_SIZE = 16 * 1024 * 1024
+IMPORT_READ_BLOCK = 1024 * 1024
+
+# Кількість записів, які записуються у файл одним блоком, і розмір буфера файлу під час експорту/імпорту
+EXPORT_BATCH_SIZE = 1000
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Кількість одночасних розпаковувань архівів і розмір блоку для потокового копіювання їх вмісту
+ARCHIVE_WORKERS = 4
+ARCHIVE_STREAM_CHUNK = 1024 * 1024
+
+# Події inotify (linux/inotify.h), на які реагує режим стеження за папкою
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+INOTIFY_EVENT = struct.Struct('iIII')
+
 
 class Contact:
     def __init__(self, name, address, phone, email, birthday):
@@ -31,9 +74,452 @@ class Note:
         self.tags = tags or []
 
 
+def split_csv_chunks(file_path, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Розбиває CSV-файл на частини по межах записів, не розриваючи поля в лапках.
+    Args:
+        file_path (str): Шлях до CSV-файлу.
+        chunk_size (int): Орієнтовний розмір однієї частини в байтах.
+    Returns:
+        tuple: Рядок заголовка (bytes) та список діапазонів (start, end) у байтах.
+    """
+    chunks = []
+    with open(file_path, 'rb') as fh:
+        header = fh.readline()
+        start = position = len(header)
+        target = start + chunk_size
+        in_quotes = False
+
+        while True:
+            block = fh.read(IMPORT_READ_BLOCK)
+            if not block:
+                break
+
+            offset = 0
+            while offset < len(block):
+                # До досягнення розміру частини лише рахуємо лапки, щоб знати, чи ми всередині поля
+                if position + offset < target:
+                    jump = min(len(block), target - position)
+                    in_quotes ^= block.count(b'"', offset, jump) % 2 == 1
+                    offset = jump
+                    continue
+
+                newline = block.find(b'\n', offset)
+                if newline == -1:
+                    in_quotes ^= block.count(b'"', offset) % 2 == 1
+                    break
+
+                in_quotes ^= block.count(b'"', offset, newline) % 2 == 1
+                offset = newline + 1
+                # Кінець рядка поза лапками - безпечна межа запису
+                if not in_quotes:
+                    chunks.append((start, position + offset))
+                    start = position + offset
+                    target = start + chunk_size
+
+            position += len(block)
+
+        if start < position:
+            chunks.append((start, position))
+
+    return header, chunks
+
+
+def _read_csv_chunk(file_path, start, end):
+    """Зчитує частину CSV-файлу та повертає ітератор її записів."""
+    with open(file_path, 'rb') as fh:
+        fh.seek(start)
+        data = fh.read(end - start)
+    # surrogateescape дозволяє відхилити лише записи з некоректним кодуванням, а не всю частину
+    return csv.reader(io.StringIO(data.decode('utf-8', errors='surrogateescape'), newline=''))
+
+
+def _check_csv_row(row, field_count):
+    """Повертає причину відхилення запису або None, якщо запис можна обробляти далі."""
+    if len(row) != field_count:
+        return f"очікувалось полів: {field_count}, отримано: {len(row)}"
+    try:
+        ''.join(row).encode('utf-8')
+    except UnicodeEncodeError:
+        return "некоректне кодування"
+    return None
+
+
+def parse_contacts_chunk(task):
+    """
+    Розбирає та перевіряє частину файлу контактів. Виконується в окремому процесі.
+    Args:
+        task (tuple): Шлях до файлу, межі частини (start, end) та список назв полів заголовка.
+    Returns:
+        tuple: Контакти у вигляді (номер у частині, контакт), відхилені записи (номер у частині, причина, рядок)
+        і кількість записів. Порожні рядки пропускаються і не враховуються, як у csv.DictReader.
+    """
+    file_path, start, end, field_names = task
+    columns = {field: field_names.index(field) for field in ('name', 'address', 'phone', 'email', 'birthday')}
+
+    contacts = []
+    rejected = []
+    count = 0
+    for row in _read_csv_chunk(file_path, start, end):
+        if not row:
+            continue
+        count += 1
+        reason = _check_csv_row(row, len(field_names))
+        if reason is None:
+            phone = row[columns['phone']]
+            email = row[columns['email']]
+            if not PHONE_PATTERN.match(phone):
+                reason = "некоректний номер телефону"
+            elif not EMAIL_PATTERN.match(email):
+                reason = "некоректна електронна пошта"
+            else:
+                try:
+                    birthday = datetime.strptime(row[columns['birthday']], '%d-%m-%Y').date()
+                except ValueError:
+                    reason = "некоректний формат дати"
+
+        if reason is not None:
+            rejected.append((count, reason, row))
+            continue
+
+        contacts.append((count, Contact(row[columns['name']], row[columns['address']], phone, email, birthday)))
+
+    return contacts, rejected, count
+
+
+def parse_notes_chunk(task):
+    """
+    Розбирає та перевіряє частину файлу нотаток. Виконується в окремому процесі.
+    Args:
+        task (tuple): Шлях до файлу, межі частини (start, end) та список назв полів заголовка.
+    Returns:
+        tuple: Нотатки у вигляді (номер у частині, нотатка), відхилені записи (номер у частині, причина, рядок)
+        і кількість записів. Порожні рядки пропускаються і не враховуються, як у csv.DictReader.
+    """
+    file_path, start, end, field_names = task
+    text_column = field_names.index('text')
+    tags_column = field_names.index('tags')
+
+    notes = []
+    rejected = []
+    count = 0
+    for row in _read_csv_chunk(file_path, start, end):
+        if not row:
+            continue
+        count += 1
+        reason = _check_csv_row(row, len(field_names))
+        if reason is None and not row[text_column]:
+            reason = "порожній текст нотатки"
+
+        if reason is not None:
+            rejected.append((count, reason, row))
+            continue
+
+        tags = [tag for tag in row[tags_column].split(', ') if tag]
+        notes.append((count, Note(row[text_column], tags)))
+
+    return notes, rejected, count
+
+
+# Поля, за якими можна фільтрувати записи для масових операцій
+CONTACT_FILTER_FIELDS = {
+    'name': lambda contact: contact.name,
+    'address': lambda contact: contact.address,
+    'phone': lambda contact: contact.phone,
+    'email': lambda contact: contact.email,
+    'domain': lambda contact: contact.email.rpartition('@')[2],
+    'birthday': lambda contact: contact.birthday.strftime('%d-%m-%Y'),
+}
+NOTE_FILTER_FIELDS = {
+    'text': lambda note: note.text,
+    'tag': lambda note: note.tags,
+}
+
+
+def parse_filter(expression, fields):
+    """
+    Перетворює вираз фільтра на функцію перевірки запису. Умови, розділені пробілами, об'єднуються через "і":
+    'field=value' - точний збіг, 'field~value' - входження, '#tag' - скорочення для 'tag=#tag'.
+    Значення з пробілами беруться в лапки. Порівняння не враховує регістр.
+    Args:
+        expression (str): Вираз фільтра, наприклад 'domain=gmail.com' або '#old'.
+        fields (dict): Поля, доступні для фільтрації.
+    Returns:
+        callable: Функція, що повертає True для записів, які відповідають фільтру.
+    Raises:
+        ValueError: Якщо вираз порожній або містить невідоме поле чи умову.
+    """
+    try:
+        terms = shlex.split(expression)
+    except ValueError as error:
+        raise ValueError(f"Некоректний вираз фільтра: {error}")
+    if not terms:
+        raise ValueError("Вираз фільтра порожній.")
+
+    conditions = []
+    for term in terms:
+        if term.startswith('#'):
+            term = f"tag={term}"
+        match = re.fullmatch(r'(\w+)([=~])(.*)', term)
+        if match is None:
+            raise ValueError(f"Некоректна умова '{term}'. Використовуйте поле=значення або поле~значення.")
+
+        field, operator, value = match.groups()
+        if field not in fields:
+            raise ValueError(f"Невідоме поле '{field}'. Доступні поля: {', '.join(fields)}.")
+        if field == 'tag' and not value.startswith('#'):
+            value = f"#{value}"
+        conditions.append((fields[field], operator, value.lower()))
+
+    def matches(record):
+        for getter, operator, value in conditions:
+            values = getter(record)
+            if isinstance(values, str):
+                values = [values]
+            if operator == '=':
+                found = any(item.lower() == value for item in values)
+            else:
+                found = any(value in item.lower() for item in values)
+            if not found:
+                return False
+        return True
+
+    return matches
+
+
+def vcard_escape(value):
+    """Екранує текстове значення властивості vCard (RFC 6350, розділ 3.4)."""
+    return (value.replace('\\', '\\\\').replace(',', '\\,').replace(';', '\\;')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def vcard_unescape(value):
+    """Скасовує екранування текстового значення властивості vCard."""
+    result = []
+    escaped = False
+    for char in value:
+        if escaped:
+            result.append('\n' if char in 'nN' else char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def vcard_split(value, separator=';'):
+    """Розбиває значення vCard за роздільником, пропускаючи екрановані роздільники."""
+    parts = []
+    current = []
+    escaped = False
+    for char in value:
+        if escaped:
+            current.append('\\' + char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == separator:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append(''.join(current))
+    return parts
+
+
+def vcard_fold(line, limit=75):
+    """Розбиває рядок vCard на частини не довші за limit байтів, як вимагає RFC 6350."""
+    if len(line.encode('utf-8')) <= limit:
+        return line + '\r\n'
+
+    folded = []
+    current = []
+    size = 0
+    for char in line:
+        char_size = len(char.encode('utf-8'))
+        if size + char_size > limit:
+            folded.append(''.join(current))
+            # Наступні частини починаються з пробілу, який теж займає один байт
+            current = [' ']
+            size = 1
+        current.append(char)
+        size += char_size
+    folded.append(''.join(current))
+    return '\r\n'.join(folded) + '\r\n'
+
+
+def contact_to_vcard(contact):
+    """Перетворює контакт на запис vCard 4.0."""
+    lines = [
+        'BEGIN:VCARD',
+        'VERSION:4.0',
+        f'FN:{vcard_escape(contact.name)}',
+        f'ADR:;;{vcard_escape(contact.address)};;;;',
+        f'TEL;VALUE=text:{vcard_escape(contact.phone)}',
+        f'EMAIL:{vcard_escape(contact.email)}',
+        f'BDAY:{contact.birthday.strftime("%Y%m%d")}',
+        'END:VCARD',
+    ]
+    return ''.join(vcard_fold(line) for line in lines)
+
+
+def contact_to_json(contact):
+    """Перетворює контакт на рядок JSON Lines."""
+    return json.dumps({'name': contact.name, 'address': contact.address, 'phone': contact.phone,
+                       'email': contact.email, 'birthday': contact.birthday.isoformat()}, ensure_ascii=False) + '\n'
+
+
+def note_to_json(note):
+    """Перетворює нотатку на рядок JSON Lines."""
+    return json.dumps({'text': note.text, 'tags': note.tags}, ensure_ascii=False) + '\n'
+
+
+def read_text_lines(fh, progress=None, task=None):
+    """
+    Потоково читає рядки з файлу, відкритого в бінарному режимі, і оновлює прогрес за прочитаними байтами.
+    Args:
+        fh: Файл, відкритий у режимі 'rb'.
+        progress (Progress, optional): Індикатор прогресу rich.
+        task (TaskID, optional): Завдання індикатора прогресу.
+    """
+    # Прогрес оновлюється раз на EXPORT_BATCH_SIZE рядків, бо оновлення на кожен рядок коштує більше за розбір
+    pending_bytes = 0
+    for line_number, raw_line in enumerate(fh, start=1):
+        pending_bytes += len(raw_line)
+        if progress is not None and line_number % EXPORT_BATCH_SIZE == 0:
+            progress.advance(task, pending_bytes)
+            pending_bytes = 0
+        # surrogateescape не перериває імпорт через некоректний байт - такий запис відхиляє парсер
+        yield raw_line.decode('utf-8', errors='surrogateescape').rstrip('\r\n')
+
+    if progress is not None and pending_bytes:
+        progress.advance(task, pending_bytes)
+
+
+def has_invalid_bytes(line):
+    """Перевіряє, чи містить рядок байти, які не вдалося декодувати як UTF-8."""
+    try:
+        line.encode('utf-8')
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
+def vcard_unfold(lines):
+    """Об'єднує рядки vCard, що починаються з пробілу або табуляції, з попереднім рядком."""
+    previous = None
+    for line in lines:
+        if line[:1] in (' ', '\t') and previous is not None:
+            previous += line[1:]
+            continue
+        if previous is not None:
+            yield previous
+        previous = line
+    if previous is not None:
+        yield previous
+
+
+def parse_vcards(lines):
+    """
+    Потоково розбирає записи vCard. Повертає словники з полями контакту або з причиною відхилення.
+    Args:
+        lines (iterable): Рядки файлу vCard без символів кінця рядка.
+    """
+    properties = None
+    invalid = False
+    for line in vcard_unfold(lines):
+        if not line:
+            continue
+        name_part, _, value = line.partition(':')
+        name = name_part.split(';')[0].rpartition('.')[2].upper()
+
+        if name == 'BEGIN':
+            properties = {}
+            invalid = False
+        elif name == 'END':
+            if properties is not None:
+                if invalid:
+                    yield {'error': "некоректне кодування"}
+                else:
+                    yield contact_record_from_vcard(properties)
+            properties = None
+        elif properties is not None:
+            invalid = invalid or has_invalid_bytes(line)
+            properties.setdefault(name, value)
+
+
+def contact_record_from_vcard(properties):
+    """Перетворює властивості одного запису vCard на словник полів контакту."""
+    birthday = properties.get('BDAY', '').replace('-', '')
+    try:
+        birthday = datetime.strptime(birthday[:8], '%Y%m%d').date()
+    except ValueError:
+        return {'error': "відсутня або некоректна дата народження", 'name': vcard_unescape(properties.get('FN', ''))}
+
+    address_parts = vcard_split(properties.get('ADR', ''))
+    address = vcard_unescape(address_parts[2]) if len(address_parts) > 2 else ''
+    phone = properties.get('TEL', '')
+    if phone.lower().startswith('tel:'):
+        phone = phone[4:]
+
+    return {
+        'name': vcard_unescape(properties.get('FN', '')),
+        'address': address,
+        'phone': vcard_unescape(phone),
+        'email': vcard_unescape(properties.get('EMAIL', '')),
+        'birthday': birthday,
+    }
+
+
+def parse_contacts_jsonl(lines):
+    """Потоково розбирає контакти у форматі JSON Lines."""
+    for line in lines:
+        if not line.strip():
+            continue
+        if has_invalid_bytes(line):
+            yield {'error': "некоректне кодування"}
+            continue
+        try:
+            data = json.loads(line)
+            record = {field: data[field] for field in ('name', 'phone', 'email', 'birthday')}
+            record['address'] = data.get('address', '')
+            wrong_fields = [field for field, value in record.items() if not isinstance(value, str)]
+            if wrong_fields:
+                yield {'error': f"поля мають бути рядками: {', '.join(wrong_fields)}"}
+                continue
+            record['birthday'] = date.fromisoformat(record['birthday'])
+            yield record
+        except (ValueError, KeyError, TypeError) as error:
+            yield {'error': f"некоректний запис JSON: {error}"}
+
+
+def parse_notes_jsonl(lines):
+    """Потоково розбирає нотатки у форматі JSON Lines."""
+    for line in lines:
+        if not line.strip():
+            continue
+        if has_invalid_bytes(line):
+            yield {'error': "некоректне кодування"}
+            continue
+        try:
+            data = json.loads(line)
+            text = data['text']
+            tags = data.get('tags', [])
+            if not isinstance(text, str):
+                yield {'error': "поле text має бути рядком"}
+            elif not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+                yield {'error': "поле tags має бути списком рядків"}
+            else:
+                yield {'text': text, 'tags': tags}
+        except (ValueError, KeyError, TypeError) as error:
+            yield {'error': f"некоректний запис JSON: {error}"}
+
+
 class FolderOrganizer:
-    def __init__(self, folder_path=None):
+    def __init__(self, folder_path=None, max_workers=ARCHIVE_WORKERS):
         self.folder_path = folder_path
+        self.max_workers = max_workers
 
         self.CYRILLIC_SYMBOLS = 'абвгдеёжзийклмнопрстуфхцчшщъыьэюяєіїґ'
         self.TRANSLATION = (
@@ -71,13 +557,171 @@ class FolderOrganizer:
             target_folder = target_folder / 'MY_OTHER'
 
         target_folder.mkdir(exist_ok=True, parents=True)
-        target_path = target_folder / normalized_name
-
-        if target_path.exists():
-            target_path = target_folder / f"{normalized_name.stem}_{normalized_name.suffix}"
+        target_path = self.unique_path(target_folder / normalized_name)
 
         shutil.move(str(file_name), str(target_path))
 
+    def unique_path(self, target_path: Path) -> Path:
+        """Повертає шлях, що ще не існує, додаючи до назви файлу суфікс _<номер> за потреби."""
+        counter = 1
+        unique = target_path
+        while unique.exists():
+            unique = target_path.with_name(f"{target_path.stem}_{counter}{target_path.suffix}")
+            counter += 1
+        return unique
+
+    def is_archive(self, file_name: Path) -> bool:
+        return self.get_extension(file_name) in self.KNOWN_EXTENSIONS['Archives']
+
+    def safe_member_path(self, member_name: str, extract_folder: Path):
+        """
+        Перетворює назву елемента архіву на нормалізований шлях всередині папки розпакування.
+        Args:
+            member_name (str): Назва елемента в архіві.
+            extract_folder (Path): Папка, куди розпаковується архів.
+        Returns:
+            Path or None: Шлях для запису або None, якщо назва виходить за межі папки.
+        """
+        member_path = PurePosixPath(member_name.replace('\\', '/'))
+        if member_path.is_absolute() or '..' in member_path.parts:
+            return None
+
+        parts = [self.normalize(part) for part in member_path.parts if part not in ('', '.')]
+        if not parts:
+            return None
+
+        target_path = extract_folder.joinpath(*parts)
+        if not target_path.resolve().is_relative_to(extract_folder.resolve()):
+            return None
+        return target_path
+
+    def extract_stream(self, source, target_path: Path) -> Path:
+        """
+        Потоково копіює вміст елемента архіву у файл, не завантажуючи його повністю в пам'ять.
+        Якщо файл з такою назвою вже є (наприклад, дві назви нормалізувались однаково), додається суфікс.
+        Returns:
+            Path: Шлях, за яким файл фактично записано.
+        """
+        target_path.parent.mkdir(exist_ok=True, parents=True)
+        target_path = self.unique_path(target_path)
+        with open(target_path, 'xb') as fh:
+            shutil.copyfileobj(source, fh, ARCHIVE_STREAM_CHUNK)
+        return target_path
+
+    def extract_archive(self, archive_path: Path, extract_folder: Path):
+        """
+        Розпаковує ZIP, TAR або GZ архів у вказану папку з нормалізованими назвами файлів.
+        Елементи з небезпечними шляхами та посилання пропускаються.
+        Args:
+            archive_path (Path): Шлях до архіву.
+            extract_folder (Path): Папка для розпакування.
+        Returns:
+            list: Шляхи до розпакованих файлів.
+        """
+        extracted = []
+        rejected = []
+
+        try:
+            if zipfile.is_zipfile(archive_path):
+                with zipfile.ZipFile(archive_path) as archive:
+                    for member in archive.infolist():
+                        if member.is_dir():
+                            continue
+                        target_path = self.safe_member_path(member.filename, extract_folder)
+                        if target_path is None:
+                            rejected.append(member.filename)
+                            continue
+                        with archive.open(member) as source:
+                            extracted.append(self.extract_stream(source, target_path))
+            elif tarfile.is_tarfile(archive_path):
+                with tarfile.open(archive_path, 'r:*') as archive:
+                    for member in archive:
+                        if member.isdir():
+                            continue
+                        target_path = self.safe_member_path(member.name, extract_folder)
+                        if target_path is None or not member.isfile():
+                            rejected.append(member.name)
+                            continue
+                        with archive.extractfile(member) as source:
+                            extracted.append(self.extract_stream(source, target_path))
+            elif self.get_extension(archive_path) == 'GZ':
+                target_path = extract_folder / self.normalize(archive_path.stem)
+                with gzip.open(archive_path, 'rb') as source:
+                    extracted.append(self.extract_stream(source, target_path))
+            else:
+                console.print(f'[red]Файл "{archive_path.name}" не є архівом, розпакування пропущено.[/red]')
+        except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError,
+                RuntimeError, NotImplementedError) as error:
+            # RuntimeError - зашифрований елемент ZIP, NotImplementedError - непідтримуваний метод стиснення
+            console.print(f'[red]Не вдалося розпакувати архів "{archive_path.name}": {error}[/red]')
+
+        if rejected:
+            console.print(f'[yellow]В архіві "{archive_path.name}" пропущено небезпечні елементи: '
+                          f'{", ".join(rejected)}[/yellow]')
+        return extracted
+
+    def move_file(self, file_name: Path, target_folder: Path) -> bool:
+        """
+        Сортує один файл через handle_file, повідомляючи про помилку замість її поширення,
+        щоб один недоступний файл не зупиняв сортування решти.
+        Returns:
+            bool: True, якщо файл переміщено.
+        """
+        try:
+            self.handle_file(file_name, target_folder)
+        except OSError as error:
+            console.print(f'[red]Не вдалося відсортувати файл "{file_name.name}": {error}[/red]')
+            return False
+        return True
+
+    def sort_extracted(self, extracted, extract_folder: Path):
+        """
+        Сортує розпаковані файли в папці архіву та видаляє порожні папки, що залишилися.
+        Returns:
+            list: Файли, які не вдалося відсортувати.
+        """
+        failed = [file_path for file_path in extracted if not self.move_file(file_path, extract_folder)]
+
+        for root, dirs, files in os.walk(extract_folder, topdown=False):
+            if Path(root) != extract_folder and not os.listdir(root):
+                os.rmdir(root)
+        return failed
+
+    def organize_files(self, files):
+        """
+        Сортує вказані файли папки. Архіви розпаковуються в пулі потоків одночасно
+        із сортуванням решти файлів, а вміст кожного архіву сортується одразу після розпакування.
+        Args:
+            files (iterable): Шляхи до файлів у папці self.folder_path.
+        Returns:
+            list: Файли, які не вдалося відсортувати.
+        """
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            extractions = {}
+            for item in files:
+                if self.is_archive(item):
+                    extract_folder = self.folder_path / 'Archives' / self.normalize(item.stem)
+                    if any(extract_folder == folder for _, folder in extractions.values()):
+                        extract_folder = extract_folder.with_name(
+                            f"{extract_folder.name}_{self.get_extension(item).lower()}")
+                    future = executor.submit(self.extract_archive, item, extract_folder)
+                    extractions[future] = (item, extract_folder)
+                elif not self.move_file(item, self.folder_path):
+                    failed.append(item)
+
+            for future in as_completed(extractions):
+                archive_path, extract_folder = extractions[future]
+                try:
+                    failed.extend(self.sort_extracted(future.result(), extract_folder))
+                except OSError as error:
+                    console.print(f'[red]Не вдалося відсортувати вміст архіву "{archive_path.name}": {error}[/red]')
+                # Оригінальний архів переміщується лише після завершення його розпакування
+                if not self.move_file(archive_path, self.folder_path):
+                    failed.append(archive_path)
+
+        return failed
+
     def organize_folder(self, local_path):
         self.folder_path = Path(local_path)
 
@@ -93,12 +737,341 @@ class FolderOrganizer:
                     FolderOrganizer.organize_folder(new_user_input)
                     return
         else:
-            for item in self.folder_path.iterdir():
-                if item.is_file():
-                    self.handle_file(item, self.folder_path)
+            self.organize_files([item for item in self.folder_path.iterdir() if item.is_file()])
             console.print(f'[green]Файли в папці "{self.folder_path.name}" відсортовані.[/green]')
 
 
+class FolderWatcher:
+    def __init__(self, organizer: FolderOrganizer, folder_path, debounce=1.0, poll_interval=1.0,
+                 max_pending=10000, max_batch=500):
+        """
+        Стежить за папкою і сортує нові файли пакетами, не скануючи папку повністю.
+        Args:
+            organizer (FolderOrganizer): Сортувальник, який обробляє файли.
+            folder_path (str): Папка для стеження.
+            debounce (float): Скільки секунд файл має не змінюватись, щоб вважатися записаним.
+            poll_interval (float): Інтервал опитування папки, якщо inotify недоступний.
+            max_pending (int): Максимальна кількість файлів у черзі, після якої нові події не читаються.
+            max_batch (int): Максимальна кількість файлів в одному пакеті сортування.
+        """
+        self.organizer = organizer
+        self.folder_path = Path(folder_path)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+
+        # Ім'я файлу -> (час першої події, час останньої події)
+        self.pending = {}
+        # Файли, які ще записуються: була подія створення/зміни, але ще не було закриття після запису
+        self.open_files = set()
+        self.snapshot = {}
+        self.stop_event = threading.Event()
+        self.inotify_fd = None
+        self.rescan_needed = False
+
+        self.stats = {
+            'events': 0,
+            'batches': 0,
+            'sorted': 0,
+            'backpressure_pauses': 0,
+            'overflows': 0,
+            'errors': 0,
+            'max_queue_depth': 0,
+            'total_latency': 0.0,
+            'latency_samples': 0,
+            'max_latency': 0.0,
+        }
+
+    def open_inotify(self):
+        """Підписується на події папки через inotify. Повертає False, якщо inotify недоступний."""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return False
+            mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MOVED_FROM
+            if libc.inotify_add_watch(fd, os.fsencode(self.folder_path), mask) < 0:
+                os.close(fd)
+                return False
+        except (OSError, AttributeError):
+            return False
+
+        self.inotify_fd = fd
+        return True
+
+    def read_inotify_events(self, timeout):
+        """
+        Зчитує доступні події inotify і повертає імена змінених файлів.
+        Файл стає придатним для сортування лише після IN_CLOSE_WRITE або IN_MOVED_TO.
+        """
+        names = []
+        readable, _, _ = select.select([self.inotify_fd], [], [], timeout)
+        if not readable:
+            return names
+
+        try:
+            data = os.read(self.inotify_fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+
+        offset = 0
+        while offset < len(data):
+            _, mask, _, name_length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset:offset + name_length].rstrip(b'\0'))
+            offset += name_length
+
+            if mask & IN_Q_OVERFLOW:
+                # Ядро втратило частину подій - єдиний випадок, коли папку потрібно переглянути
+                self.stats['overflows'] += 1
+                self.rescan_needed = True
+            elif not name or mask & IN_ISDIR:
+                continue
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                # Файл зник з папки до сортування - більше не чекаємо на нього
+                self.open_files.discard(name)
+                self.pending.pop(name, None)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                self.open_files.discard(name)
+                names.append(name)
+            else:
+                self.open_files.add(name)
+                names.append(name)
+        return names
+
+    def poll_changes(self, timeout):
+        """Резервний режим без inotify: порівнює розміри і час зміни файлів з попереднім знімком."""
+        self.stop_event.wait(timeout)
+        names = []
+        current = {}
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                current[entry.name] = (stat.st_size, stat.st_mtime_ns)
+                if self.snapshot.get(entry.name) != current[entry.name]:
+                    names.append(entry.name)
+        self.snapshot = current
+        return names
+
+    def queue_events(self, names):
+        now = time.monotonic()
+        for name in names:
+            self.stats['events'] += 1
+            first_seen, _ = self.pending.get(name, (now, now))
+            self.pending[name] = (first_seen, now)
+        self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], len(self.pending))
+
+    def flush_ready(self):
+        """
+        Сортує файли, які не змінювались довше за debounce і вже закриті після запису,
+        пакетами не більше max_batch.
+        """
+        now = time.monotonic()
+        ready = [name for name, (_, last_seen) in self.pending.items()
+                 if now - last_seen >= self.debounce and name not in self.open_files]
+        for start in range(0, len(ready), self.max_batch):
+            batch = ready[start:start + self.max_batch]
+            files = [self.folder_path / name for name in batch if (self.folder_path / name).is_file()]
+            failed = self.organizer.organize_files(files)
+
+            sorted_at = time.monotonic()
+            for name in batch:
+                first_seen, _ = self.pending.pop(name)
+                latency = sorted_at - first_seen
+                self.stats['total_latency'] += latency
+                self.stats['latency_samples'] += 1
+                self.stats['max_latency'] = max(self.stats['max_latency'], latency)
+            self.stats['batches'] += 1
+            self.stats['sorted'] += len(files) - len(failed)
+            self.stats['errors'] += len(failed)
+
+    def watch(self):
+        """
+        Основний цикл стеження. Працює до виклику stop() або натискання Ctrl+C.
+        Файли, що вже лежать у папці, сортуються при запуску.
+        """
+        self.organizer.folder_path = self.folder_path
+        use_inotify = self.open_inotify()
+        mode = 'inotify' if use_inotify else 'опитування'
+        console.print(f'[green]Стеження за папкою "{self.folder_path}" ({mode}). Ctrl+C - зупинити.[/green]')
+
+        # Перший знімок папки ставить у чергу файли, що вже лежать у ній
+        self.queue_events(self.poll_changes(0))
+
+        try:
+            while not self.stop_event.is_set():
+                timeout = min(self.debounce, self.poll_interval) / 2
+                try:
+                    if len(self.pending) >= self.max_pending:
+                        # Черга переповнена: нові події лишаються в черзі ядра, доки не розберемо поточні
+                        self.stats['backpressure_pauses'] += 1
+                        self.stop_event.wait(timeout)
+                    elif use_inotify:
+                        self.queue_events(self.read_inotify_events(timeout))
+                    else:
+                        self.queue_events(self.poll_changes(timeout))
+
+                    if self.rescan_needed:
+                        # Після втрати подій невідомо, які файли вже закриті, тож діє лише правило тиші
+                        self.rescan_needed = False
+                        self.open_files.clear()
+                        self.snapshot = {}
+                        self.queue_events(self.poll_changes(0))
+
+                    self.flush_ready()
+                except OSError as error:
+                    # Помилка файлової системи не повинна зупиняти тривале стеження
+                    self.stats['errors'] += 1
+                    console.print(f'[red]Помилка під час стеження за папкою: {error}[/red]')
+                    if not self.folder_path.is_dir():
+                        console.print(f'[red]Папка "{self.folder_path}" більше не існує. Стеження зупинено.[/red]')
+                        break
+                    self.stop_event.wait(timeout)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.inotify_fd is not None:
+                os.close(self.inotify_fd)
+                self.inotify_fd = None
+
+        self.print_stats()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def print_stats(self):
+        """Виводить лічильники роботи режиму стеження."""
+        processed = self.stats['sorted']
+        samples = self.stats['latency_samples']
+        average_latency = self.stats['total_latency'] / samples if samples else 0.0
+
+        table = Table(title="Статистика стеження за папкою")
+        table.add_column("[cyan]Показник[/cyan]")
+        table.add_column("[green]Значення[/green]")
+
+        rows = [
+            ("Отримано подій", str(self.stats['events'])),
+            ("Відсортовано файлів", str(processed)),
+            ("Пакетів", str(self.stats['batches'])),
+            ("Поточна глибина черги", str(len(self.pending))),
+            ("Максимальна глибина черги", str(self.stats['max_queue_depth'])),
+            ("Пауз через переповнення черги", str(self.stats['backpressure_pauses'])),
+            ("Переповнень черги inotify", str(self.stats['overflows'])),
+            ("Помилок сортування", str(self.stats['errors'])),
+            ("Середня затримка, с", f"{average_latency:.3f}"),
+            ("Максимальна затримка, с", f"{self.stats['max_latency']:.3f}"),
+        ]
+        for name, value in rows:
+            table.add_row(Text(name, style="cyan"), Text(value, style="green"))
+
+        console.print(table, justify="center")
+
+
+class AddressBookAnalytics:
+    MONTHS = ['Січень', 'Лютий', 'Березень', 'Квітень', 'Травень', 'Червень',
+              'Липень', 'Серпень', 'Вересень', 'Жовтень', 'Листопад', 'Грудень']
+
+    def __init__(self, contacts, notes, today=None):
+        """
+        Один раз будує колонкові масиви з контактів і нотаток, за якими рахуються всі звіти.
+        Args:
+            contacts (list): Список контактів.
+            notes (list): Список нотаток.
+            today (datetime.date, optional): Дата, відносно якої рахується вік. За замовчуванням - сьогодні.
+        """
+        self.today = today or datetime.today().date()
+
+        # Дні народження як кількість днів від 1970-01-01
+        epoch = date(1970, 1, 1).toordinal()
+        birthdays = np.fromiter((contact.birthday.toordinal() - epoch for contact in contacts),
+                                dtype=np.int64, count=len(contacts)).astype('datetime64[D]')
+        months_since_epoch = birthdays.astype('datetime64[M]')
+        self.birth_years = birthdays.astype('datetime64[Y]').astype(np.int64) + 1970
+        self.birth_months = months_since_epoch.astype(np.int64) % 12 + 1
+        self.birth_days = (birthdays - months_since_epoch.astype('datetime64[D]')).astype(np.int64) + 1
+
+        # Коди доменів електронної пошти
+        self.domains = {}
+        self.domain_codes = np.fromiter(
+            (self.domains.setdefault(contact.email.rpartition('@')[2].lower(), len(self.domains))
+             for contact in contacts), dtype=np.int64, count=len(contacts))
+        self.domain_names = np.array(list(self.domains), dtype=object)
+
+        # Теги нотаток у вигляді пар (номер нотатки, код тегу), відсортованих за нотатками
+        self.tags = {}
+        note_index = []
+        tag_codes = []
+        for index, note in enumerate(notes):
+            for tag in dict.fromkeys(note.tags):
+                if tag:
+                    note_index.append(index)
+                    tag_codes.append(self.tags.setdefault(tag, len(self.tags)))
+        self.note_index = np.array(note_index, dtype=np.int64)
+        self.tag_codes = np.array(tag_codes, dtype=np.int64)
+        self.tag_names = np.array(list(self.tags), dtype=object)
+
+    def ages(self):
+        had_birthday = (self.birth_months * 100 + self.birth_days) <= (self.today.month * 100 + self.today.day)
+        return np.clip(self.today.year - self.birth_years - 1 + had_birthday, 0, None)
+
+    def age_distribution(self):
+        counts = np.bincount(self.ages() // 10)
+        return [(f"{decade * 10}-{decade * 10 + 9}", int(count)) for decade, count in enumerate(counts) if count]
+
+    def birthdays_per_month(self):
+        counts = np.bincount(self.birth_months, minlength=13)[1:]
+        return [(month, int(count)) for month, count in zip(self.MONTHS, counts)]
+
+    def top_email_domains(self, limit=10):
+        counts = np.bincount(self.domain_codes, minlength=len(self.domains))
+        top = np.argsort(-counts, kind='stable')[:limit]
+        return [(self.domain_names[code], int(counts[code])) for code in top]
+
+    def tag_frequency(self, limit=10):
+        counts = np.bincount(self.tag_codes, minlength=len(self.tags))
+        top = np.argsort(-counts, kind='stable')[:limit]
+        return [(self.tag_names[code], int(counts[code])) for code in top]
+
+    def tag_cooccurrence(self, limit=10):
+        """Рахує, скільки разів кожна пара тегів зустрічається в одній нотатці."""
+        if not len(self.tag_codes):
+            return []
+
+        # Для кожного тегу нотатки генеруємо всі теги тієї ж нотатки і залишаємо пари (a, b), де a < b
+        note_sizes = np.bincount(self.note_index)
+        note_starts = np.cumsum(note_sizes) - note_sizes
+        repeats = note_sizes[self.note_index]
+        left = np.repeat(self.tag_codes, repeats)
+        pair_offsets = np.arange(len(left)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        right = self.tag_codes[np.repeat(note_starts[self.note_index], repeats) + pair_offsets]
+
+        mask = left < right
+        pair_codes = left[mask] * len(self.tags) + right[mask]
+        if len(self.tags) ** 2 <= 1 << 24:
+            # Для помірної кількості тегів лічильник усіх пар поміщається в пам'ять і не потребує сортування
+            pair_counts = np.bincount(pair_codes, minlength=len(self.tags) ** 2)
+            pairs = np.flatnonzero(pair_counts)
+            counts = pair_counts[pairs]
+        else:
+            pairs, counts = np.unique(pair_codes, return_counts=True)
+        top = np.argsort(-counts, kind='stable')[:limit]
+        return [(f"{self.tag_names[pairs[i] // len(self.tags)]} + {self.tag_names[pairs[i] % len(self.tags)]}",
+                 int(counts[i])) for i in top]
+
+    def reports(self):
+        """Повертає всі звіти у вигляді словника: назва -> (заголовки колонок, рядки)."""
+        return {
+            'Розподіл за віком': (('Вік', 'Контактів'), self.age_distribution()),
+            'Дні народження за місяцями': (('Місяць', 'Контактів'), self.birthdays_per_month()),
+            'Популярні домени пошти': (('Домен', 'Контактів'), self.top_email_domains()),
+            'Популярні теги': (('Тег', 'Нотаток'), self.tag_frequency()),
+            'Теги, що зустрічаються разом': (('Пара тегів', 'Нотаток'), self.tag_cooccurrence()),
+        }
+
+
 class ConsoleInterface(ABC):
     @abstractmethod
     def list_contacts(self):
@@ -120,7 +1093,9 @@ class AssistantInterface(ConsoleInterface):
         self.commands = ['додати контакт', 'список контактів', 'пошук контактів', 'дні народження',
                          'редагувати контакт', 'видалити контакт', 'сортувати файли',
                          'додати нотатку', 'пошук нотаток', 'видалити нотатку', 'список нотаток',
-                         'редагувати нотатку', 'сортувати нотатки', 'допомога', 'вихід']
+                         'редагувати нотатку', 'сортувати нотатки', 'імпорт контактів', 'імпорт нотаток',
+                         'стежити за папкою', 'аналітика', 'масове видалення', 'масове редагування',
+                         'експорт контактів', 'експорт нотаток', 'допомога', 'вихід']
 
         # Встановлення автодоповнення на основі доступних команд
         self.command_completer = WordCompleter(self.commands)
@@ -217,9 +1192,7 @@ class AssistantFunctionality:
             bool: True, якщо номер телефону відповідає формату, False - інакше.
         """
         # Перевірка правильності формату номера телефону
-        # Допустимі формати: +380501234567, 050-123-45-67, 0501234567, (050)123-45-67, 0989898989
-        phone_pattern = re.compile(r'^\+?\d{1,3}?[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}$')
-        return bool(re.match(phone_pattern, phone))
+        return bool(PHONE_PATTERN.match(phone))
 
     def is_valid_email(self, email):
         """
@@ -230,8 +1203,7 @@ class AssistantFunctionality:
             bool: True, якщо адреса електронної пошти відповідає формату, False - інакше.
         """
         # Перевірка правильності формату електронної пошти
-        email_pattern = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
-        return bool(re.match(email_pattern, email))
+        return bool(EMAIL_PATTERN.match(email))
 
     def add_contact_from_console(self):
         """
@@ -308,7 +1280,7 @@ class AssistantFunctionality:
         """
         file_path = 'addressbook.csv'
         if os.path.exists(file_path):
-            with open(file_path, newline='\n') as fh:
+            with open(file_path, newline='\n', encoding='utf-8') as fh:
                 reader = csv.DictReader(fh)
                 for row in reader:
                     name = row['name']
@@ -335,7 +1307,7 @@ class AssistantFunctionality:
         """
         Зберігає нотатки у файл CSV.
         """
-        with open('notes.csv', 'w', newline='\n') as fh:
+        with open('notes.csv', 'w', newline='\n', encoding='utf-8') as fh:
             field_names = ['text', 'tags']
             writer = csv.DictWriter(fh, fieldnames=field_names)
             writer.writeheader()
@@ -348,7 +1320,7 @@ class AssistantFunctionality:
         """
         file_path = 'notes.csv'
         if os.path.exists(file_path):
-            with open(file_path, newline='\n') as fh:
+            with open(file_path, newline='\n', encoding='utf-8') as fh:
                 reader = csv.DictReader(fh)
                 for row in reader:
                     text = row['text']
@@ -364,6 +1336,266 @@ class AssistantFunctionality:
         else:
             print(f"Файл '{file_path}' не знайдено. Спробуйте створити файл або перевірити шлях.")
 
+    def bulk_import(self, file_path, parse_chunk, required_fields, target, workers=None,
+                    chunk_size=IMPORT_CHUNK_SIZE, unique_phones=False):
+        """
+        Паралельно імпортує великий CSV-файл: ділить його на частини, розбирає їх у пулі процесів
+        і додає результати до колекції в початковому порядку.
+        Args:
+            file_path (str): Шлях до CSV-файлу.
+            parse_chunk (callable): Функція розбору однієї частини (parse_contacts_chunk або parse_notes_chunk).
+            required_fields (tuple): Обов'язкові поля заголовка.
+            target (list): Колекція, до якої додаються імпортовані записи.
+            workers (int, optional): Кількість процесів. За замовчуванням - кількість ядер.
+            chunk_size (int, optional): Орієнтовний розмір частини в байтах.
+            unique_phones (bool, optional): Відхиляти контакти з номером телефону, який уже є в книзі,
+                як це робить add_contact.
+        Returns:
+            list: Відхилені записи у вигляді (номер запису, причина, рядок).
+        """
+        if not os.path.exists(file_path):
+            console.print(f"[red]Файл '{file_path}' не знайдено.[/red]")
+            return []
+
+        header, chunks = split_csv_chunks(file_path, chunk_size)
+        field_names = next(csv.reader([header.decode('utf-8-sig')]), [])
+        missing_fields = [field for field in required_fields if field not in field_names]
+        if missing_fields:
+            console.print(f"[bold red]Помилка:[/bold red] У файлі відсутні поля: {', '.join(missing_fields)}.")
+            return []
+
+        tasks = [(file_path, start, end, field_names) for start, end in chunks]
+        if len(tasks) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(parse_chunk, tasks))
+        else:
+            # Для невеликих файлів запуск пулу процесів коштує більше, ніж сам розбір
+            results = [parse_chunk(task) for task in tasks]
+
+        rejected = []
+        imported = 0
+        records_before = 0
+        known_phones = {contact.phone for contact in self.contacts} if unique_phones else None
+        for records, chunk_rejected, count in results:
+            for index, record in records:
+                if known_phones is not None:
+                    if record.phone in known_phones:
+                        row = [record.name, record.address, record.phone, record.email,
+                               record.birthday.strftime('%d-%m-%Y')]
+                        rejected.append((records_before + index, "контакт з таким номером телефону вже існує", row))
+                        continue
+                    known_phones.add(record.phone)
+                target.append(record)
+                imported += 1
+            rejected.extend((records_before + index, reason, row) for index, reason, row in chunk_rejected)
+            records_before += count
+
+        # Відхилені записи з різних перевірок виводяться в порядку файлу
+        rejected.sort(key=lambda item: item[0])
+
+        console.print(f"[green]Імпортовано записів: {imported}.[/green]")
+        if rejected:
+            self.report_rejected_rows(file_path, rejected, field_names)
+        return rejected
+
+    def bulk_load(self, file_path='addressbook.csv', workers=None):
+        """
+        Масово завантажує контакти з великого CSV-файлу з використанням усіх ядер.
+        Args:
+            file_path (str, optional): Шлях до CSV-файлу. За замовчуванням - 'addressbook.csv'.
+            workers (int, optional): Кількість процесів. За замовчуванням - кількість ядер.
+        """
+        return self.bulk_import(file_path, parse_contacts_chunk, ('name', 'address', 'phone', 'email', 'birthday'),
+                                self.contacts, workers, unique_phones=True)
+
+    def bulk_load_notes(self, file_path='notes.csv', workers=None):
+        """
+        Масово завантажує нотатки з великого CSV-файлу з використанням усіх ядер.
+        Args:
+            file_path (str, optional): Шлях до CSV-файлу. За замовчуванням - 'notes.csv'.
+            workers (int, optional): Кількість процесів. За замовчуванням - кількість ядер.
+        """
+        return self.bulk_import(file_path, parse_notes_chunk, ('text', 'tags'), self.notes, workers)
+
+    def report_rejected_rows(self, file_path, rejected, field_names=(), limit=20):
+        """
+        Зберігає звіт про відхилені записи у CSV-файл поруч з імпортованим і виводить перші з них.
+        Поля запису зберігаються окремими колонками, тому їх можна відновити без втрат.
+        Args:
+            file_path (str): Шлях до імпортованого файлу.
+            rejected (list): Відхилені записи у вигляді (номер запису, причина, рядок).
+            field_names (list, optional): Заголовок імпортованого файлу.
+            limit (int, optional): Кількість записів для виведення в консоль.
+        """
+        source = Path(file_path)
+        report_path = source.with_name(f"{source.stem}_rejected.csv")
+        # surrogateescape повертає у звіт оригінальні байти записів з некоректним кодуванням
+        with open(report_path, 'w', newline='', encoding='utf-8', errors='surrogateescape') as fh:
+            writer = csv.writer(fh)
+            writer.writerow(['record', 'reason', *field_names])
+            for index, reason, row in rejected:
+                writer.writerow([index, reason, *row])
+
+        table = Table(title=f"Відхилені записи ({len(rejected)})")
+        table.add_column("[cyan]Запис[/cyan]")
+        table.add_column("[red]Причина[/red]")
+        table.add_column("[yellow]Дані[/yellow]")
+
+        for index, reason, row in rejected[:limit]:
+            raw = ','.join(row).encode('utf-8', errors='replace').decode('utf-8')
+            table.add_row(Text(str(index), style="cyan"), Text(reason, style="red"), Text(raw, style="yellow"))
+
+        console.print(table, justify="center")
+        console.print(f"[yellow]Повний звіт збережено у файл '{report_path}'.[/yellow]")
+
+    def add_contacts(self, records):
+        """
+        Додає контакти пакетом з тими ж перевірками, що й add_contact, але без повідомлення
+        про кожен контакт і з перевіркою дублікатів за множиною телефонів, побудованою один раз.
+        Args:
+            records (iterable): Словники з полями name, address, phone, email, birthday (або error).
+        Returns:
+            tuple: Кількість доданих контактів і список відхилених записів (номер, причина).
+        """
+        known_phones = {contact.phone for contact in self.contacts}
+
+        added = 0
+        rejected = []
+        for index, record in enumerate(records, start=1):
+            if 'error' in record:
+                rejected.append((index, record['error']))
+            elif not self.is_valid_phone(record['phone']):
+                rejected.append((index, "некоректний номер телефону"))
+            elif not self.is_valid_email(record['email']):
+                rejected.append((index, "некоректна електронна пошта"))
+            elif record['phone'] in known_phones:
+                rejected.append((index, "контакт з таким номером телефону вже існує"))
+            else:
+                self.contacts.append(Contact(record['name'], record['address'], record['phone'],
+                                             record['email'], record['birthday']))
+                known_phones.add(record['phone'])
+                added += 1
+
+        return added, rejected
+
+    def add_notes(self, records):
+        """
+        Додає нотатки пакетом, форматуючи теги так само, як add_note.
+        Args:
+            records (iterable): Словники з полями text і tags.
+        Returns:
+            tuple: Кількість доданих нотаток і список відхилених записів (номер, причина).
+        """
+        added = 0
+        rejected = []
+        for index, record in enumerate(records, start=1):
+            if 'error' in record:
+                rejected.append((index, record['error']))
+                continue
+            tags = [tag.strip() if tag.startswith('#') else f"#{tag.strip()}" for tag in record['tags'] if tag.strip()]
+            self.notes.append(Note(record['text'], tags))
+            added += 1
+        return added, rejected
+
+    def export_records(self, file_path, records, serialize, title):
+        """
+        Потоково записує записи у файл великими блоками з індикатором прогресу.
+        Args:
+            file_path (str): Шлях до файлу.
+            records (list): Контакти або нотатки.
+            serialize (callable): Функція перетворення запису на текст (contact_to_vcard, contact_to_json, note_to_json).
+            title (str): Підпис індикатора прогресу.
+        """
+        records_iter = iter(records)
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as fh, \
+                Progress(console=console) as progress:
+            task = progress.add_task(title, total=len(records))
+            while True:
+                batch = list(islice(records_iter, EXPORT_BATCH_SIZE))
+                if not batch:
+                    break
+                fh.write(''.join(serialize(record) for record in batch))
+                progress.advance(task, len(batch))
+
+        console.print(f"[green]Експортовано записів: {len(records)} у файл '{file_path}'.[/green]")
+
+    def export_contacts(self, file_path):
+        """
+        Експортує контакти у формат vCard 4.0 (.vcf) або JSON Lines (.jsonl) за розширенням файлу.
+        Args:
+            file_path (str): Шлях до файлу.
+        """
+        serializers = {'.vcf': contact_to_vcard, '.vcard': contact_to_vcard, '.jsonl': contact_to_json}
+        serialize = serializers.get(Path(file_path).suffix.lower())
+        if serialize is None:
+            console.print("[bold red]Помилка:[/bold red] Підтримуються файли .vcf, .vcard та .jsonl.")
+            return
+        self.export_records(file_path, self.contacts, serialize, "Експорт контактів")
+
+    def export_notes(self, file_path):
+        """
+        Експортує нотатки у формат JSON Lines.
+        Args:
+            file_path (str): Шлях до файлу .jsonl.
+        """
+        if Path(file_path).suffix.lower() != '.jsonl':
+            console.print("[bold red]Помилка:[/bold red] Нотатки експортуються лише у файли .jsonl.")
+            return
+        self.export_records(file_path, self.notes, note_to_json, "Експорт нотаток")
+
+    def import_records(self, file_path, parse, add_records, title):
+        """
+        Потоково імпортує записи з файлу: рядки читаються, розбираються і додаються по одному,
+        тому пам'ять не залежить від розміру файлу.
+        Args:
+            file_path (str): Шлях до файлу.
+            parse (callable): Генератор, що перетворює рядки файлу на словники записів.
+            add_records (callable): Функція пакетного додавання (add_contacts або add_notes).
+            title (str): Підпис індикатора прогресу.
+        Returns:
+            tuple: Кількість доданих записів і список відхилених записів (номер, причина).
+        """
+        with open(file_path, 'rb', buffering=EXPORT_BUFFER_SIZE) as fh, Progress(console=console) as progress:
+            task = progress.add_task(title, total=os.fstat(fh.fileno()).st_size)
+            added, rejected = add_records(parse(read_text_lines(fh, progress, task)))
+
+        console.print(f"[green]Імпортовано записів: {added}.[/green]")
+        if rejected:
+            console.print(f"[yellow]Відхилено записів: {len(rejected)}.[/yellow]")
+            for index, reason in rejected[:10]:
+                console.print(f"[yellow]  запис {index}: {reason}[/yellow]")
+        return added, rejected
+
+    def import_contacts(self, file_path):
+        """
+        Імпортує контакти з файлу vCard (.vcf) або JSON Lines (.jsonl).
+        Args:
+            file_path (str): Шлях до файлу.
+        """
+        parsers = {'.vcf': parse_vcards, '.vcard': parse_vcards, '.jsonl': parse_contacts_jsonl}
+        parse = parsers.get(Path(file_path).suffix.lower())
+        if parse is None:
+            console.print("[bold red]Помилка:[/bold red] Підтримуються файли .vcf, .vcard та .jsonl.")
+            return
+        if not os.path.exists(file_path):
+            console.print(f"[red]Файл '{file_path}' не знайдено.[/red]")
+            return
+        return self.import_records(file_path, parse, self.add_contacts, "Імпорт контактів")
+
+    def import_notes(self, file_path):
+        """
+        Імпортує нотатки з файлу JSON Lines.
+        Args:
+            file_path (str): Шлях до файлу .jsonl.
+        """
+        if Path(file_path).suffix.lower() != '.jsonl':
+            console.print("[bold red]Помилка:[/bold red] Нотатки імпортуються лише з файлів .jsonl.")
+            return
+        if not os.path.exists(file_path):
+            console.print(f"[red]Файл '{file_path}' не знайдено.[/red]")
+            return
+        return self.import_records(file_path, parse_notes_jsonl, self.add_notes, "Імпорт нотаток")
+
     def upcoming_birthdays(self, days):
         """
         Виводить інформацію про найближчі дні народження у наступні визначені дні.
@@ -658,6 +1890,165 @@ class AssistantFunctionality:
         else:
             console.print(f"[red]Немає результатів пошуку для запиту: {query}[/red]")
 
+    def bulk_collection(self, kind):
+        """
+        Повертає колекцію, доступні поля фільтра та функцію збереження для масових операцій.
+        Args:
+            kind (str): 'контакти' або 'нотатки'.
+        Returns:
+            tuple or None: (колекція, поля фільтра, функція збереження) або None для невідомого типу.
+        """
+        if kind == 'контакти':
+            return self.contacts, CONTACT_FILTER_FIELDS, self.dump
+        if kind == 'нотатки':
+            return self.notes, NOTE_FILTER_FIELDS, self.dump_notes
+        console.print("[red]Невідомий тип записів. Введіть 'контакти' або 'нотатки'.[/red]")
+        return None
+
+    def preview_matches(self, kind, matching, limit=10):
+        """Виводить кількість знайдених записів і перші з них перед підтвердженням масової операції."""
+        console.print(f"[bold cyan]Знайдено записів: {len(matching)}[/bold cyan]")
+
+        table = Table(title="Попередній перегляд")
+        if kind == 'контакти':
+            table.add_column("[blue]Ім'я[/blue]")
+            table.add_column("[green]Адреса[/green]")
+            table.add_column("[cyan]Електронна пошта[/cyan]")
+            for contact in matching[:limit]:
+                table.add_row(Text(contact.name, style="blue"), Text(contact.address, style="green"),
+                              Text(contact.email, style="cyan"))
+        else:
+            table.add_column("[blue]Текст[/blue]")
+            table.add_column("[cyan]Теги[/cyan]")
+            for note in matching[:limit]:
+                table.add_row(Text(note.text, style="blue"), Text(", ".join(note.tags), style="cyan"))
+
+        console.print(table, justify="center")
+
+    def bulk_delete(self, kind=None, expression=None, confirm=True):
+        """
+        Видаляє всі контакти або нотатки, що відповідають фільтру, за один прохід і зберігає файл один раз.
+        Args:
+            kind (str, optional): 'контакти' або 'нотатки'. За замовчуванням - запитується у користувача.
+            expression (str, optional): Вираз фільтра, наприклад '#old'. За замовчуванням - запитується.
+            confirm (bool, optional): Чи запитувати підтвердження після попереднього перегляду.
+        Returns:
+            int: Кількість видалених записів.
+        """
+        if kind is None:
+            kind = input("Що видаляти? (контакти/нотатки): ").strip().lower()
+        collection = self.bulk_collection(kind)
+        if collection is None:
+            return 0
+        records, fields, persist = collection
+
+        if expression is None:
+            expression = input(f"Фільтр (поля: {', '.join(fields)}; наприклад, '#old' або 'domain=gmail.com'): ")
+        try:
+            matches = parse_filter(expression, fields)
+        except ValueError as error:
+            console.print(f"[bold red]Помилка:[/bold red] {error}")
+            return 0
+
+        kept = []
+        matching = []
+        for record in records:
+            (matching if matches(record) else kept).append(record)
+
+        if not matching:
+            console.print(f"[red]Немає записів, що відповідають фільтру: {expression}[/red]")
+            return 0
+
+        self.preview_matches(kind, matching)
+        if confirm and input(f"Видалити {len(matching)} записів? (так/ні): ").strip().lower() != 'так':
+            console.print("[cyan]Видалення скасовано користувачем.[/cyan]")
+            return 0
+
+        # Заміна вмісту списку на місці, бо його спільно використовують AssistantInterface і AssistantFunctionality
+        records[:] = kept
+        persist()
+        console.print(f"[green]Видалено записів: {len(matching)}.[/green]")
+        return len(matching)
+
+    def bulk_edit(self, kind=None, expression=None, field=None, value=None, confirm=True):
+        """
+        Змінює поле в усіх контактах або нотатках, що відповідають фільтру, і зберігає файл один раз.
+        Для нотаток поле 'tags' замінює теги, а 'text' - текст.
+        Args:
+            kind (str, optional): 'контакти' або 'нотатки'. За замовчуванням - запитується у користувача.
+            expression (str, optional): Вираз фільтра. За замовчуванням - запитується.
+            field (str, optional): Поле, яке потрібно змінити. За замовчуванням - запитується.
+            value (str, optional): Нове значення поля. За замовчуванням - запитується.
+            confirm (bool, optional): Чи запитувати підтвердження після попереднього перегляду.
+        Returns:
+            int: Кількість змінених записів.
+        """
+        if kind is None:
+            kind = input("Що редагувати? (контакти/нотатки): ").strip().lower()
+        collection = self.bulk_collection(kind)
+        if collection is None:
+            return 0
+        records, fields, persist = collection
+
+        if expression is None:
+            expression = input(f"Фільтр (поля: {', '.join(fields)}; наприклад, '#old' або 'domain=gmail.com'): ")
+        try:
+            matches = parse_filter(expression, fields)
+        except ValueError as error:
+            console.print(f"[bold red]Помилка:[/bold red] {error}")
+            return 0
+
+        editable_fields = ('name', 'address', 'phone', 'email', 'birthday') if kind == 'контакти' else ('text', 'tags')
+        if field is None:
+            field = input(f"Яке поле змінити? ({', '.join(editable_fields)}): ").strip().lower()
+        if field not in editable_fields:
+            console.print(f"[bold red]Помилка:[/bold red] Поле '{field}' не можна змінити.")
+            return 0
+        if value is None:
+            value = input("Нове значення: ")
+
+        # Перевірка та перетворення нового значення один раз перед проходом по записах
+        if field == 'phone' and not self.is_valid_phone(value):
+            console.print("[bold red]Помилка:[/bold red] Некоректний номер телефону.")
+            return 0
+        if field == 'email' and not self.is_valid_email(value):
+            console.print("[bold red]Помилка:[/bold red] Некоректна електронна пошта.")
+            return 0
+        if field == 'birthday':
+            try:
+                value = parser.parse(value).date()
+            except (ValueError, OverflowError):
+                console.print("[bold red]Помилка:[/bold red] Некоректний формат дати.")
+                return 0
+        if field == 'tags':
+            value = [tag.strip() if tag.strip().startswith('#') else f"#{tag.strip()}"
+                     for tag in value.split(',') if tag.strip()]
+
+        matching = [record for record in records if matches(record)]
+        if not matching:
+            console.print(f"[red]Немає записів, що відповідають фільтру: {expression}[/red]")
+            return 0
+
+        # Номер телефону має бути унікальним, як і в add_contact
+        if field == 'phone':
+            if len(matching) > 1:
+                console.print("[bold red]Помилка:[/bold red] Один номер телефону не можна встановити кільком контактам.")
+                return 0
+            if any(contact.phone == value for contact in self.contacts if contact is not matching[0]):
+                console.print("[bold red]Помилка:[/bold red] Контакт з таким номером телефону вже існує.")
+                return 0
+
+        self.preview_matches(kind, matching)
+        if confirm and input(f"Змінити поле '{field}' у {len(matching)} записах? (так/ні): ").strip().lower() != 'так':
+            console.print("[cyan]Редагування скасовано користувачем.[/cyan]")
+            return 0
+
+        for record in matching:
+            setattr(record, field, list(value) if field == 'tags' else value)
+        persist()
+        console.print(f"[green]Змінено записів: {len(matching)}.[/green]")
+        return len(matching)
+
     def sort_notes_by_tags(self):
         """
         Сортує нотатки за тегами та виводить результат у вигляді табличного вигляду.
@@ -690,6 +2081,42 @@ class AssistantFunctionality:
 
         console.print(table)
 
+    def show_analytics(self):
+        """
+        Виводить аналітичні звіти по книзі контактів і нотатках та за бажанням зберігає їх у CSV.
+        """
+        if not self.contacts and not self.notes:
+            console.print("[red]Немає контактів і нотаток для аналізу.[/red]")
+            return
+
+        reports = AddressBookAnalytics(self.contacts, self.notes).reports()
+
+        for title, (columns, rows) in reports.items():
+            table = Table(title=title)
+            table.add_column(f"[blue]{columns[0]}[/blue]")
+            table.add_column(f"[green]{columns[1]}[/green]", justify="right")
+            for label, count in rows:
+                table.add_row(Text(str(label), style="blue"), Text(str(count), style="green"))
+            console.print(table, justify="center")
+
+        if input("Зберегти звіти у файл CSV? (так/ні): ").strip().lower() == 'так':
+            self.export_analytics(reports)
+
+    def export_analytics(self, reports, file_path='analytics.csv'):
+        """
+        Зберігає аналітичні звіти у файл CSV.
+        Args:
+            reports (dict): Звіти у вигляді назва -> (заголовки колонок, рядки).
+            file_path (str, optional): Шлях до файлу. За замовчуванням - 'analytics.csv'.
+        """
+        with open(file_path, 'w', newline='', encoding='utf-8') as fh:
+            writer = csv.writer(fh)
+            writer.writerow(['report', 'label', 'value'])
+            for title, (_, rows) in reports.items():
+                for label, count in rows:
+                    writer.writerow([title, label, count])
+        console.print(f"[green]Звіти збережено у файл '{file_path}'.[/green]")
+
     def analyze_user_input(self, user_input):
         normalized_input = user_input.lower()
         if "додати контакт" in normalized_input:
@@ -717,6 +2144,22 @@ class AssistantFunctionality:
             console.print("[green]Відсортовані нотатки: [/green]")
         elif "сортувати файли" in normalized_input:
             console.print("[green]Для сортування файлів: [/green]")
+        elif "масове видалення" in normalized_input:
+            console.print("[green]Видалення всіх записів, що відповідають фільтру:[/green]")
+        elif "масове редагування" in normalized_input:
+            console.print("[green]Редагування всіх записів, що відповідають фільтру:[/green]")
+        elif "аналітика" in normalized_input:
+            console.print("[green]Аналітика по книзі контактів і нотатках:[/green]")
+        elif "стежити за папкою" in normalized_input:
+            console.print("[green]Режим стеження за папкою: нові файли сортуються автоматично.[/green]")
+        elif "імпорт контактів" in normalized_input:
+            console.print("[green]Імпорт контактів з файлу CSV, vCard (.vcf) або JSON Lines (.jsonl):[/green]")
+        elif "імпорт нотаток" in normalized_input:
+            console.print("[green]Імпорт нотаток з файлу CSV або JSON Lines (.jsonl):[/green]")
+        elif "експорт контактів" in normalized_input:
+            console.print("[green]Експорт контактів у файл vCard (.vcf) або JSON Lines (.jsonl):[/green]")
+        elif "експорт нотаток" in normalized_input:
+            console.print("[green]Експорт нотаток у файл JSON Lines (.jsonl):[/green]")
         elif "вихід" in normalized_input:
             console.print("[green]До нових зустрічей![/green]")
         elif "допомога" in normalized_input:
@@ -779,6 +2222,40 @@ class AssistantFunctionality:
             elif "сортувати файли" in user_input.lower():
                 local_path = input("Введіть назву папки або шлях до папки для сортування: ")
                 sorter.organize_folder(local_path)
+            elif "аналітика" in user_input.lower():
+                self.show_analytics()
+            elif "масове видалення" in user_input.lower():
+                self.bulk_delete()
+            elif "масове редагування" in user_input.lower():
+                self.bulk_edit()
+            elif "стежити за папкою" in user_input.lower():
+                local_path = input("Введіть назву папки або шлях до папки для стеження: ")
+                if not Path(local_path).is_dir():
+                    console.print(f'[red]Папка "{local_path}" не існує.[/red]')
+                    continue
+                try:
+                    debounce = float(input("Затримка перед сортуванням файлу в секундах (Enter - 1): ") or 1)
+                except ValueError:
+                    debounce = 1.0
+                FolderWatcher(sorter, local_path, debounce=debounce).watch()
+            elif "імпорт контактів" in user_input.lower():
+                file_path = input("Введіть шлях до файлу з контактами (.csv, .vcf, .jsonl): ")
+                if Path(file_path).suffix.lower() == '.csv':
+                    self.bulk_load(file_path)
+                else:
+                    self.import_contacts(file_path)
+            elif "імпорт нотаток" in user_input.lower():
+                file_path = input("Введіть шлях до файлу з нотатками (.csv, .jsonl): ")
+                if Path(file_path).suffix.lower() == '.csv':
+                    self.bulk_load_notes(file_path)
+                else:
+                    self.import_notes(file_path)
+            elif "експорт контактів" in user_input.lower():
+                file_path = input("Введіть шлях до файлу для експорту контактів (.vcf, .jsonl): ")
+                self.export_contacts(file_path)
+            elif "експорт нотаток" in user_input.lower():
+                file_path = input("Введіть шлях до файлу для експорту нотаток (.jsonl): ")
+                self.export_notes(file_path)
             elif "вихід" in user_input.lower():
                 self.dump()
                 self.dump_notes()